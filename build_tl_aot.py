@@ -0,0 +1,24 @@
+# Ahead-of-time build of the transmission line kernels with Numba.
+# Run once with Numba installed: python build_tl_aot.py
+# The resulting tl_kernels extension is picked up by transmission_line.py,
+# so neither a JIT compile nor a cache load is needed at run time.
+import os
+import warnings
+
+from numba.core.errors import NumbaPendingDeprecationWarning
+
+# numba.pycc is pending deprecation; silence only that notice, not compile warnings
+warnings.filterwarnings("ignore", category=NumbaPendingDeprecationWarning)
+
+from numba.pycc import CC
+
+import transmission_line
+
+cc = CC('tl_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Same plain-Python kernel that the JIT path compiles
+cc.export('sweep_two_wire', 'void(f8, f8, f8, f8, f8[:], f8[:], f8[:], f8[:], f8[:])')(transmission_line._sweep_two_wire)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,117 @@
+# Equivalence check of the optional accelerated backends against the NumPy path.
+# Run with: python check_backends.py
+# The size thresholds are forced low so every installed backend (AOT kernel,
+# Numba JIT kernels, Numba ufunc, numexpr, pyarrow) runs on a small sweep;
+# backends that are not installed or not built are reported as skipped.
+import os
+import tempfile
+
+import numpy as np
+
+import sw_converter
+import transmission_line as tl
+
+RTOL = 1e-12
+
+# 14-gauge two-wire line from transmission_line.py
+TWO_WIRE = (0.000813, 0.02, 1, 1, 1, 3.0e-15, 5.8e7)
+LENGTHS = np.arange(100, 5100, 100, dtype=np.float64)
+FREQS = np.array([60.0, 1e3, 1e6])
+
+
+def check(name, result, expected):
+    for field, r, e in zip("RLCG", result, expected):
+        np.testing.assert_allclose(r, e, rtol=RTOL, err_msg=f"{name}: {field}")
+    print(f"{name:<24} ok")
+
+
+def skip(name, reason):
+    print(f"{name:<24} skipped ({reason})")
+
+
+def numpy_two_wire():
+    aot, have_numba = tl._aot_sweep_two_wire, tl.HAVE_NUMBA
+    tl._aot_sweep_two_wire, tl.HAVE_NUMBA = None, False
+    try:
+        return (tl.cal_two_wire_params_sweep(*TWO_WIRE, LENGTHS, 60),
+                tl.cal_two_wire_params_sweep_2d(*TWO_WIRE, LENGTHS, FREQS))
+    finally:
+        tl._aot_sweep_two_wire, tl.HAVE_NUMBA = aot, have_numba
+
+
+def check_transmission_line():
+    expected_1d, expected_2d = numpy_two_wire()
+
+    # Scalar reference for the NumPy sweep itself
+    check("numpy sweep", expected_1d,
+          [np.array(p) for p in zip(*(tl.cal_two_wire_params(*TWO_WIRE, x, 60) for x in LENGTHS))])
+
+    if tl._aot_sweep_two_wire is not None:
+        check("aot sweep", tl.cal_two_wire_params_sweep(*TWO_WIRE, LENGTHS, 60), expected_1d)
+    else:
+        skip("aot sweep", "run build_tl_aot.py first")
+
+    if tl.HAVE_NUMBA and tl._numba_kernels() is not None:
+        aot, jit_min_size = tl._aot_sweep_two_wire, tl._JIT_MIN_SIZE
+        tl._aot_sweep_two_wire, tl._JIT_MIN_SIZE = None, 1
+        try:
+            check("jit sweep", tl.cal_two_wire_params_sweep(*TWO_WIRE, LENGTHS, 60), expected_1d)
+            check("jit sweep 2d", tl.cal_two_wire_params_sweep_2d(*TWO_WIRE, LENGTHS, FREQS), expected_2d)
+        finally:
+            tl._aot_sweep_two_wire, tl._JIT_MIN_SIZE = aot, jit_min_size
+    else:
+        skip("jit sweep", "numba not available")
+
+
+def check_csv():
+    table = np.column_stack([LENGTHS, *numpy_two_wire()[0]])
+    arrow_min_rows = tl._ARROW_MIN_ROWS
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_filename = os.path.join(tmp, "results.csv")
+        tl._ARROW_MIN_ROWS = 1
+        try:
+            tl.write_results_csv(csv_filename, table)
+        finally:
+            tl._ARROW_MIN_ROWS = arrow_min_rows
+        with open(csv_filename, encoding="utf-8") as csvfile:
+            header = csvfile.readline().strip()
+        written = np.loadtxt(csv_filename, delimiter=",", skiprows=1)
+
+    assert header == "Length (m),R (Ohm),L (H),C (F),G (S)", header
+    # Full precision with pyarrow, %.6e without it
+    np.testing.assert_allclose(written, table, rtol=1e-6)
+    print(f"{'csv export':<24} ok")
+
+
+def check_sw_converter():
+    VIN = np.linspace(3.0, 4.5, 1000)
+    args = (VIN, 5.0, 0.85, 3.8e6, 0.56e-6, 1.0)
+    expected = np.array([sw_converter.calculate_peak_current(float(v), *args[1:]) for v in VIN])
+
+    ufunc_min_size, numexpr_min_size = sw_converter._UFUNC_MIN_SIZE, sw_converter._NUMEXPR_MIN_SIZE
+    sw_converter._UFUNC_MIN_SIZE = sw_converter._NUMEXPR_MIN_SIZE = 10**12
+    try:
+        np.testing.assert_allclose(sw_converter.calculate_peak_current(*args), expected, rtol=RTOL)
+        print(f"{'peak current numpy':<24} ok")
+
+        if sw_converter._numexpr() is not None:
+            sw_converter._NUMEXPR_MIN_SIZE = 1
+            np.testing.assert_allclose(sw_converter.calculate_peak_current(*args), expected, rtol=RTOL)
+            print(f"{'peak current numexpr':<24} ok")
+        else:
+            skip("peak current numexpr", "numexpr not installed")
+
+        if sw_converter._peak_current_ufunc() is not None:
+            sw_converter._UFUNC_MIN_SIZE = 1
+            np.testing.assert_allclose(sw_converter.calculate_peak_current(*args), expected, rtol=RTOL)
+            print(f"{'peak current ufunc':<24} ok")
+        else:
+            skip("peak current ufunc", "numba not available")
+    finally:
+        sw_converter._UFUNC_MIN_SIZE, sw_converter._NUMEXPR_MIN_SIZE = ufunc_min_size, numexpr_min_size
+
+
+if __name__ == "__main__":
+    check_transmission_line()
+    check_csv()
+    check_sw_converter()